@@ -21,11 +21,125 @@ __version__   = '1.3'
 __url__       = 'https://github.com/tehmaze/sauce'
 
 import datetime
+import mmap
+import operator
 import os
 import struct
-from io import StringIO
+from functools import partial
 from io import IOBase
 
+# numpy structured dtype layout matching the 128-byte SAUCE record, used by
+# SAUCE.scan_many (kept as plain tuples so numpy stays an optional import)
+SCAN_DTYPE = [
+    ('sauce',        'S5'),
+    ('sauceversion', 'S2'),
+    ('title',        'S35'),
+    ('author',       'S20'),
+    ('group',        'S20'),
+    ('date',         'S8'),
+    ('filesize',     '<u4'),
+    ('datatype',     'u1'),
+    ('filetype',     'u1'),
+    ('tinfo1',       '<u2'),
+    ('tinfo2',       '<u2'),
+    ('tinfo3',       '<u2'),
+    ('tinfo4',       '<u2'),
+    ('comments',     'u1'),
+    ('flags',        'u1'),
+    ('filler',       'S22'),
+]
+
+# numeric fields extracted by SAUCE.scan_tails; 'valid' flags offsets that
+# actually carry a SAUCE id
+SCAN_NUMERIC_DTYPE = [
+    ('valid',    'u1'),
+    ('filesize', '<u4'),
+    ('datatype', 'u1'),
+    ('filetype', 'u1'),
+    ('tinfo1',   '<u2'),
+    ('tinfo2',   '<u2'),
+    ('tinfo3',   '<u2'),
+    ('tinfo4',   '<u2'),
+    ('flags',    'u1'),
+]
+
+# compiled scan kernel, built on first use (None: not built, False: no numba)
+_scan_tails = None
+
+def _build_scan_tails():
+    # Compile the numeric tail scanner with numba; called at most once per
+    # process since compilation is expensive.
+    import numba
+    import numpy
+
+    record = numba.from_dtype(numpy.dtype(SCAN_NUMERIC_DTYPE))
+
+    @numba.njit(cache=True)
+    def scan_tails(buf, offsets):
+        out = numpy.zeros(offsets.shape[0], dtype=record)
+        for i in range(offsets.shape[0]):
+            o = offsets[i]
+            if buf[o] != 0x53 or buf[o + 1] != 0x41 or \
+                    buf[o + 2] != 0x55 or buf[o + 3] != 0x43 or \
+                    buf[o + 4] != 0x45:
+                continue
+            out[i]['valid'] = 1
+            out[i]['filesize'] = numpy.uint32(buf[o + 90]) | \
+                numpy.uint32(buf[o + 91]) << 8 | \
+                numpy.uint32(buf[o + 92]) << 16 | \
+                numpy.uint32(buf[o + 93]) << 24
+            out[i]['datatype'] = buf[o + 94]
+            out[i]['filetype'] = buf[o + 95]
+            out[i]['tinfo1'] = numpy.uint16(buf[o + 96]) | \
+                numpy.uint16(buf[o + 97]) << 8
+            out[i]['tinfo2'] = numpy.uint16(buf[o + 98]) | \
+                numpy.uint16(buf[o + 99]) << 8
+            out[i]['tinfo3'] = numpy.uint16(buf[o + 100]) | \
+                numpy.uint16(buf[o + 101]) << 8
+            out[i]['tinfo4'] = numpy.uint16(buf[o + 102]) | \
+                numpy.uint16(buf[o + 103]) << 8
+            out[i]['flags'] = buf[o + 105]
+        return out
+
+    return scan_tails
+
+class SauceField(object):
+    '''
+    Data descriptor for a single SAUCE record field. The compiled struct
+    reader and result unwrapper are bound when the SAUCE class is defined,
+    so reading an attribute is one C-level __get__ call straight into the
+    record; writes are routed through the field's set_* method so type
+    coercion and cache invalidation keep working.
+    '''
+
+    __slots__ = ('key', 'reader', 'unwrap', 'fset', 'text')
+
+    def __init__(self, key, reader, unwrap, fset=None, text=False):
+        self.key = key
+        self.reader = reader
+        self.unwrap = unwrap
+        self.fset = fset
+        self.text = text
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if obj.record is None:
+            return None
+        if self.text:
+            try:
+                return obj._cache[self.key]
+            except KeyError:
+                data = obj._cache[self.key] = self.unwrap(
+                    self.reader(obj.record)).strip().decode('latin-1')
+                return data
+        return self.unwrap(self.reader(obj.record))
+
+    def __set__(self, obj, value):
+        if self.fset is None:
+            raise AttributeError('{} is read-only'.format(self.key))
+        self.fset(obj, value)
+
 class SAUCE(object):
     '''
     Parser for SAUCE or Standard Architecture for Universal Comment Extensions,
@@ -64,24 +178,44 @@ class SAUCE(object):
     # template
     template  = (
         # name           default         size type
-        ('SAUCE',        'SAUCE',        5,   '5s'),
-        ('SAUCEVersion', '00',           2,   '2s'),
-        ('Title',        '\x00' * 35,   35,   '35s'),
-        ('Author',       '\x00' * 20,   20,   '20s'),
-        ('Group',        '\x00' * 20,   20,   '20s'),
-        ('Date',         '\x00' * 8,     8,   '8s'),
-        ('FileSize',     [0],            4,   'I'),
-        ('DataType',     [0],            1,   'B'),
-        ('FileType',     [0],            1,   'B'),
-        ('TInfo1',       [0],            2,   'H'),
-        ('TInfo2',       [0],            2,   'H'),
-        ('TInfo3',       [0],            2,   'H'),
-        ('TInfo4',       [0],            2,   'H'),
-        ('Comments',     [0],            1,   'B'),
-        ('Flags',        [0],            1,   'B'),
-        ('Filler',       ['\x00'] * 22, 22,   '22c'),
+        ('SAUCE',        b'SAUCE',       5,   '5s'),
+        ('SAUCEVersion', b'00',          2,   '2s'),
+        ('Title',        b'\x00' * 35,  35,   '35s'),
+        ('Author',       b'\x00' * 20,  20,   '20s'),
+        ('Group',        b'\x00' * 20,  20,   '20s'),
+        ('Date',         b'\x00' * 8,    8,   '8s'),
+        ('FileSize',     0,              4,   'I'),
+        ('DataType',     0,              1,   'B'),
+        ('FileType',     0,              1,   'B'),
+        ('TInfo1',       0,              2,   'H'),
+        ('TInfo2',       0,              2,   'H'),
+        ('TInfo3',       0,              2,   'H'),
+        ('TInfo4',       0,              2,   'H'),
+        ('Comments',     0,              1,   'B'),
+        ('Flags',        0,              1,   'B'),
+        ('Filler',       b'\x00' * 22,  22,   '22s'),
     )
-    templates = [t[0] for t in template]
+    # compiled once, so field access does not re-parse the format string
+    structs   = {t[0]: struct.Struct(t[3]) for t in template}
+    # one compiled struct covering the whole 128-byte record; SAUCE is
+    # little-endian regardless of host, hence the explicit '<'
+    record_struct   = struct.Struct('<' + ''.join(t[3] for t in template))
+    record_defaults = tuple(t[1] for t in template)
+    # name -> (default, offset, size, type), offsets accumulated once
+    fields    = {}
+    # name -> bound Struct.unpack_from with the field offset baked in
+    readers   = {}
+    # name -> unpacked tuple to field value, picked per format up front so
+    # _gets does not branch on the format string per call
+    unwraps   = {}
+    _offset   = 0
+    for _name, _default, _size, _stype in template:
+        fields[_name] = (_default, _offset, _size, _stype)
+        readers[_name] = partial(structs[_name].unpack_from, offset=_offset)
+        unwraps[_name] = b''.join if _stype[-1] == 'c' else \
+            operator.itemgetter(0)
+        _offset += _size
+    del _name, _default, _size, _stype, _offset
     datatypes = ['None', 'Character', 'Graphics', 'Vector', 'Sound',
                  'BinaryText', 'XBin', 'Archive', 'Executable']
     filetypes = {
@@ -129,46 +263,91 @@ class SAUCE(object):
                          'UC2', 'PAK', 'SQZ'],
         },
     }
+    # datatype code -> name, padded to the full byte range so lookups need
+    # no bounds check
+    datatype_names = tuple(datatypes) + (None,) * (256 - len(datatypes))
+    # (datatype code, filetype code) -> name in one flat table
+    filetype_names = {}
+    for _datatype, _info in filetypes.items():
+        for _index, _filetype in enumerate(_info.get('filetype', ())):
+            filetype_names[datatypes.index(_datatype), _index] = _filetype
+    del _datatype, _info, _index, _filetype
+    # datatype -> normalized filetype name -> index, so set_filetype resolves
+    # names with a dict lookup instead of scanning the name list
+    filetype_index = {
+        _datatype: {_n.lower().title(): _i
+                    for _i, _n in enumerate(_info['filetype'])}
+        for _datatype, _info in filetypes.items() if 'filetype' in _info
+    }
+
+    __slots__ = ('filehand', '_size', 'record', 'data', '_cache', '_mmap')
 
-    def __init__(self, filename='', data=''):
-        assert (filename or data), 'Need either filename or record'
+    def __init__(self, filename=None, data=None):
+        if filename is None and data is None:
+            raise ValueError('Need either filename or data')
 
-        if filename:
+        self._cache = {}
+        self._mmap = None
+        if filename is not None:
             if isinstance(filename, IOBase):
                 self.filehand = filename
             else:
                 self.filehand = open(filename, 'rb')
-            self._size = os.path.getsize(self.filehand.name)
+            try:
+                self._size = os.fstat(self.filehand.fileno()).st_size
+            except OSError:
+                # file objects without a real descriptor, e.g. BytesIO
+                self.filehand.seek(0, 2)
+                self._size = self.filehand.tell()
+            self.record, self.data = self._read()
         else:
+            # in-memory data needs no file object or read calls at all
+            if isinstance(data, str):
+                data = data.encode('latin-1')
+            self.filehand = None
             self._size = len(data)
-            self.filehand = StringIO(data)
+            self.record, self.data = self._read_data(memoryview(data))
 
-        self.record, self.data = self._read()
+    def __bytes__(self):
+        if self.record is None:
+            return bytes(self.data)
+        return bytes(self.data) + bytes(self.record)
 
     def __str__(self):
-        return ''.join(list(self._read_file()))
+        return bytes(self.data).decode('latin-1')
 
     def _read_file(self):
-        # Buffered reader (generator), reads the original file without SAUCE
-        # record.
-        self.filehand.seek(0)
-        # Check if we have SAUCE data
-        if self.record:
-            reads, rest = divmod(self._size - 128, 1024)
-        else:
-            reads, rest = divmod(self._size, 1024)
-        for x in range(0, reads):
-            yield self.filehand.read(1024)
-        if rest:
-            yield self.filehand.read(rest)
+        # The file without SAUCE record, already read into memory by _read;
+        # no need to seek back and re-read it in chunks.
+        yield self.data
+
+    def _read_data(self, data):
+        if self._size >= 128 and data[self._size - 128:self._size - 123] == \
+                b'SAUCE':
+            return bytearray(data[self._size - 128:]), data[:self._size - 128]
+        return None, data
 
     def _read(self):
         if self._size >= 128:
+            try:
+                # map the file so the body is paged in by the kernel on
+                # demand instead of copied into userspace up front
+                self._mmap = mmap.mmap(self.filehand.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass
+            else:
+                data = memoryview(self._mmap)
+                record = data[self._size - 128:]
+                if record[:5] == b'SAUCE':
+                    return bytearray(record), data[:self._size - 128]
+                return None, data
+
             self.filehand.seek(self._size - 128)
             record = self.filehand.read(128)
             if record.startswith(b'SAUCE'):
                 self.filehand.seek(0)
-                return record, self.filehand.read(self._size - 128)
+                return bytearray(record), self.filehand.read(self._size - 128)
 
         self.filehand.seek(0)
         return None, self.filehand.read()
@@ -177,33 +356,95 @@ class SAUCE(object):
         if self.record is None:
             return None
 
-        name, default, offset, size, stype = self._template(key)
-        data = self.record[offset:offset + size]
-        data = struct.unpack(stype, data)
-        if stype[-1] in 'cs':
-            return b''.join(data)
-        elif stype[-1] in 'BI' and len(stype) == 1:
-            return data[0]
-        else:
+        return self.unwraps[key](self.readers[key](self.record))
+
+    def _gets_str(self, key):
+        # Decoded text fields are cached; _puts drops the cached value on
+        # write, so repeated reads cost a single dict lookup.
+        try:
+            return self._cache[key]
+        except KeyError:
+            data = self._cache[key] = self._gets(key).strip().decode('latin-1')
             return data
 
     def _puts(self, key, data):
-        name, default, offset, size, stype = self._template(key)
-        #print offset, size, data, repr(struct.pack(stype, data))
+        default, offset, size, stype = self.fields[key]
         if self.record is None:
             self.record = self.sauce()
-        self.record = ''.join([
-            self.record[:offset],
-            struct.pack(stype, data),
-            self.record[offset + size:]
-        ])
+        if isinstance(data, str):
+            data = data.encode('latin-1')
+        self.structs[key].pack_into(self.record, offset, data)
+        self._cache.pop(key, None)
         return self.record
 
-    def _template(self, key):
-        index = self.templates.index(key)
-        name, default, size, stype = self.template[index]
-        offset = sum([self.template[x][2] for x in range(0, index)])
-        return name, default, offset, size, stype
+    @classmethod
+    def scan_many(cls, paths):
+        '''
+        Parse the SAUCE records of many files into a single numpy structured
+        array, one row per file, with one field per SAUCE record field. Files
+        without a SAUCE record leave their row zeroed, so valid rows can be
+        selected with ``result['sauce'] == b'SAUCE'`` and filtered column-wise,
+        for example ``result[result['datatype'] == 1]`` for all character
+        data. Requires numpy.
+        '''
+        import numpy
+
+        dtype = numpy.dtype(SCAN_DTYPE)
+        result = numpy.zeros(len(paths), dtype=dtype)
+        tail = bytearray(128)
+        for index, path in enumerate(paths):
+            with open(path, 'rb') as filehand:
+                size = os.fstat(filehand.fileno()).st_size
+                if size < 128:
+                    continue
+                filehand.seek(size - 128)
+                if filehand.readinto(tail) == 128 and \
+                        tail.startswith(b'SAUCE'):
+                    result[index] = numpy.frombuffer(bytes(tail),
+                                                     dtype=dtype)[0]
+        return result
+
+    @classmethod
+    def scan_tails(cls, buf, offsets, jit=True):
+        '''
+        Extract the numeric SAUCE fields from 128-byte record tails located
+        at ``offsets`` inside ``buf``, for example the members of an art pack
+        archive read into a single buffer. Returns a numpy structured array
+        with a ``valid`` column flagging the offsets that carry a SAUCE id.
+        With ``jit`` the scan loop runs as a numba-compiled kernel (falling
+        back to numpy when numba is not installed); the first jitted call
+        pays the compilation cost. Requires numpy.
+        '''
+        import numpy
+
+        global _scan_tails
+
+        buf = numpy.frombuffer(buf, dtype='u1')
+        offsets = numpy.asarray(offsets, dtype='i8')
+        # reject bad offsets up front; the jitted kernel runs without
+        # bounds checks and would read out-of-bounds memory
+        if offsets.size and (int(offsets.min()) < 0 or
+                             int(offsets.max()) + 128 > buf.shape[0]):
+            raise ValueError('record offset out of range')
+        if jit and _scan_tails is None:
+            try:
+                _scan_tails = _build_scan_tails()
+            except ImportError:
+                _scan_tails = False
+        if jit and _scan_tails:
+            return _scan_tails(buf, offsets)
+
+        tails = numpy.empty((offsets.shape[0], 128), dtype='u1')
+        for index, offset in enumerate(offsets):
+            tails[index] = buf[offset:offset + 128]
+        rows = tails.view(numpy.dtype(SCAN_DTYPE)).reshape(-1)
+        out = numpy.zeros(rows.shape[0],
+                          dtype=numpy.dtype(SCAN_NUMERIC_DTYPE))
+        out['valid'] = rows['sauce'] == b'SAUCE'
+        for name in ('filesize', 'datatype', 'filetype', 'tinfo1', 'tinfo2',
+                     'tinfo3', 'tinfo4', 'flags'):
+            out[name] = numpy.where(out['valid'], rows[name], 0)
+        return out
 
     def sauce(self):
         '''
@@ -211,30 +452,25 @@ class SAUCE(object):
         '''
         if self.record:
             return self.record
-        else:
-            data = 'SAUCE'
-            for name, default, size, stype in self.template[1:]:
-                #print stype, default
-                if stype[-1] in 's':
-                    data += struct.pack(stype, default)
-                else:
-                    data += struct.pack(stype, *default)
-            return data
+        return bytearray(self.record_struct.pack(*self.record_defaults))
 
     def write(self, filename):
         '''
         Save the file including SAUCE data to the given file(handle).
         '''
-        filename = type(filename) == file and filename or open(filename, 'wb')
-        for part in self._read_file():
-            filename.write(part)
+        # copy the body first: the target may be the very file backing the
+        # live mmap, and truncating that would leave self.data unmapped
+        data = bytes(self.data)
+        if not isinstance(filename, IOBase):
+            filename = open(filename, 'wb')
+        filename.write(data)
         filename.write(self.sauce())
         return filename
 
     # SAUCE meta data
 
     def get_author(self):
-        return self._gets('Author').strip()
+        return self._gets_str('Author')
 
     def set_author(self, author):
         self._puts('Author', author)
@@ -254,20 +490,17 @@ class SAUCE(object):
         datatype = self.datatype
         if datatype is None:
             return None
-        if datatype < len(self.datatypes):
-            return self.datatypes[datatype]
-        else:
-            return None
+        return self.datatype_names[datatype]
 
     def set_datatype(self, datatype):
-        if type(datatype) == str:
+        if isinstance(datatype, str):
             datatype = datatype.lower().title()  # fOoBAR -> Foobar
             datatype = self.datatypes.index(datatype)
         self._puts('DataType', datatype)
         return self
 
     def get_date(self):
-        return self._gets('Date')
+        return self._gets_str('Date')
 
     def get_date_str(self, format='%Y%m%d'):
         return datetime.datetime.strptime(self.date, format)
@@ -275,9 +508,9 @@ class SAUCE(object):
     def set_date(self, date=None, format='%Y%m%d'):
         if date is None:
             date = datetime.datetime.now().strftime(format)
-        elif type(date) in [datetime.date, datetime.datetime]:
+        elif isinstance(date, (datetime.date, datetime.datetime)):
             date = date.strftime(format)
-        elif type(date) in [int, long, float]:
+        elif isinstance(date, (int, float)):
             date = datetime.datetime.fromtimestamp(date).strftime(format)
         self._puts('Date', date)
         return self
@@ -302,24 +535,16 @@ class SAUCE(object):
         return self._gets('FileType')
 
     def get_filetype_str(self):
-        datatype = self.datatype_str
-        filetype = self.filetype
-
-        if datatype is None or filetype is None:
-            return None
-
-        if datatype in self.filetypes and \
-            'filetype' in self.filetypes[datatype] and \
-                filetype < len(self.filetypes[datatype]['filetype']):
-            return self.filetypes[datatype]['filetype'][filetype]
-        else:
+        datatype = self.datatype
+        if datatype is None:
             return None
+        return self.filetype_names.get((datatype, self.filetype))
 
     def set_filetype(self, filetype):
         datatype = self.datatype_str
-        if type(filetype) == str:
-            filetype = filetype.lower().title()  # fOoBAR -> Foobar
-            filetype = [name.lower().title() for name in self.filetypes[datatype]['filetype']].index(filetype)
+        if isinstance(filetype, str):
+            # fOoBAR -> Foobar
+            filetype = self.filetype_index[datatype][filetype.lower().title()]
         self._puts('FileType', filetype)
         return self
 
@@ -345,7 +570,7 @@ class SAUCE(object):
             return None
 
     def get_group(self):
-        return self._gets('Group').strip()
+        return self._gets_str('Group')
 
     def set_group(self, group):
         self._puts('Group', group)
@@ -364,7 +589,7 @@ class SAUCE(object):
             return ''
 
     def get_tinfo1(self):
-        return self._gets('TInfo1')[0]
+        return self._gets('TInfo1')
 
     def get_tinfo1_name(self):
         return self._get_tinfo_name(1)
@@ -374,7 +599,7 @@ class SAUCE(object):
         return self
 
     def get_tinfo2(self):
-        return self._gets('TInfo2')[0]
+        return self._gets('TInfo2')
 
     def get_tinfo2_name(self):
         return self._get_tinfo_name(2)
@@ -384,7 +609,7 @@ class SAUCE(object):
         return self
 
     def get_tinfo3(self):
-        return self._gets('TInfo3')[0]
+        return self._gets('TInfo3')
 
     def get_tinfo3_name(self):
         return self._get_tinfo_name(3)
@@ -394,7 +619,7 @@ class SAUCE(object):
         return self
 
     def get_tinfo4(self):
-        return self._gets('TInfo4')[0]
+        return self._gets('TInfo4')
 
     def get_tinfo4_name(self):
         return self._get_tinfo_name(4)
@@ -404,43 +629,65 @@ class SAUCE(object):
         return self
 
     def get_title(self):
-        return self._gets('Title').strip()
+        return self._gets_str('Title')
 
     def set_title(self, title):
         self._puts('Title', title)
         return self
 
     def get_version(self):
-        return self._gets('SAUCEVersion')
+        return self._gets_str('SAUCEVersion')
 
     def set_version(self, version):
         self._puts('SAUCEVersion', version)
         return self
 
-    # properties
-    author       = property(get_author,   set_author)
-    comments     = property(get_comments, set_comments)
-    datatype     = property(get_datatype, set_datatype)
+    # record fields as data descriptors, bound to their compiled struct
+    # once; derived values remain plain properties
+    author       = SauceField('Author', readers['Author'], unwraps['Author'],
+                              set_author, text=True)
+    comments     = SauceField('Comments', readers['Comments'],
+                              unwraps['Comments'], set_comments)
+    datatype     = SauceField('DataType', readers['DataType'],
+                              unwraps['DataType'], set_datatype)
     datatype_str = property(get_datatype_str)
-    date         = property(get_date,     set_date)
-    filesize     = property(get_filesize, set_filesize)
-    filetype     = property(get_filetype, set_filetype)
+    date         = SauceField('Date', readers['Date'], unwraps['Date'],
+                              set_date, text=True)
+    filesize     = SauceField('FileSize', readers['FileSize'],
+                              unwraps['FileSize'], set_filesize)
+    filetype     = SauceField('FileType', readers['FileType'],
+                              unwraps['FileType'], set_filetype)
     filetype_str = property(get_filetype_str)
-    filler       = property(get_filler)
+    filler       = SauceField('Filler', readers['Filler'], unwraps['Filler'])
     filler_str   = property(get_filler_str)
-    flags        = property(get_flags,    set_flags)
+    flags        = SauceField('Flags', readers['Flags'], unwraps['Flags'],
+                              set_flags)
     flags_str    = property(get_flags_str)
-    group        = property(get_group,    set_group)
-    tinfo1       = property(get_tinfo1,   set_tinfo1)
+    group        = SauceField('Group', readers['Group'], unwraps['Group'],
+                              set_group, text=True)
+    tinfo1       = SauceField('TInfo1', readers['TInfo1'], unwraps['TInfo1'],
+                              set_tinfo1)
     tinfo1_name  = property(get_tinfo1_name)
-    tinfo2       = property(get_tinfo2,   set_tinfo2)
+    tinfo2       = SauceField('TInfo2', readers['TInfo2'], unwraps['TInfo2'],
+                              set_tinfo2)
     tinfo2_name  = property(get_tinfo2_name)
-    tinfo3       = property(get_tinfo3,   set_tinfo3)
+    tinfo3       = SauceField('TInfo3', readers['TInfo3'], unwraps['TInfo3'],
+                              set_tinfo3)
     tinfo3_name  = property(get_tinfo3_name)
-    tinfo4       = property(get_tinfo4,   set_tinfo4)
+    tinfo4       = SauceField('TInfo4', readers['TInfo4'], unwraps['TInfo4'],
+                              set_tinfo4)
     tinfo4_name  = property(get_tinfo4_name)
-    title        = property(get_title,    set_title)
-    version      = property(get_version)
+    title        = SauceField('Title', readers['Title'], unwraps['Title'],
+                              set_title, text=True)
+    version      = SauceField('SAUCEVersion', readers['SAUCEVersion'],
+                              unwraps['SAUCEVersion'], text=True)
+
+
+try:
+    # optional Cython accelerator, built by setup.py when Cython is present
+    from sauce._csauce import CSauce
+except ImportError:
+    CSauce = None
 
 
 if __name__ == '__main__':
@@ -0,0 +1,176 @@
+# cython: language_level=3
+#
+# Optional Cython accelerator for SAUCE records. Built only when Cython is
+# available at setup time; sauce.CSauce is None otherwise and the pure
+# Python SAUCE class is always the canonical implementation.
+
+from libc.string cimport memcmp, memcpy
+
+
+cdef class CSauce:
+    '''
+    A single 128-byte SAUCE record held in a fixed C buffer. Field reads
+    are pointer arithmetic into the buffer, field writes mutate it in
+    place; intended for batch workloads (art pack indexers) where the
+    per-field overhead of the struct module adds up.
+    '''
+
+    cdef unsigned char buf[128]
+
+    def __init__(self, record):
+        cdef const unsigned char[::1] view = record
+        if view.shape[0] != 128:
+            raise ValueError('SAUCE record must be 128 bytes')
+        memcpy(self.buf, &view[0], 128)
+
+    @classmethod
+    def from_tails(cls, data):
+        '''
+        Split a buffer of concatenated 128-byte record tails into a list
+        of CSauce instances, one memcpy each.
+        '''
+        cdef const unsigned char[::1] view = data
+        if view.shape[0] % 128:
+            raise ValueError('buffer is not a multiple of 128 bytes')
+        return [cls(data[offset:offset + 128])
+                for offset in range(0, view.shape[0], 128)]
+
+    cdef unsigned int _u16(self, int offset):
+        return self.buf[offset] | (self.buf[offset + 1] << 8)
+
+    cdef void _set_u16(self, int offset, unsigned int value):
+        self.buf[offset] = value & 0xff
+        self.buf[offset + 1] = (value >> 8) & 0xff
+
+    cdef bytes _string(self, int offset, int size):
+        return self.buf[offset:offset + size]
+
+    cdef void _set_string(self, int offset, int size, bytes value):
+        cdef int length = min(len(value), size)
+        memcpy(self.buf + offset, <const unsigned char *> value, length)
+        for index in range(length, size):
+            self.buf[offset + index] = 0
+
+    def __bytes__(self):
+        return self.buf[:128]
+
+    @property
+    def valid(self):
+        return memcmp(self.buf, b'SAUCE', 5) == 0
+
+    @property
+    def version(self):
+        return self._string(5, 2)
+
+    @property
+    def title(self):
+        return self._string(7, 35)
+
+    @title.setter
+    def title(self, bytes value):
+        self._set_string(7, 35, value)
+
+    @property
+    def author(self):
+        return self._string(42, 20)
+
+    @author.setter
+    def author(self, bytes value):
+        self._set_string(42, 20, value)
+
+    @property
+    def group(self):
+        return self._string(62, 20)
+
+    @group.setter
+    def group(self, bytes value):
+        self._set_string(62, 20, value)
+
+    @property
+    def date(self):
+        return self._string(82, 8)
+
+    @date.setter
+    def date(self, bytes value):
+        self._set_string(82, 8, value)
+
+    @property
+    def filesize(self):
+        # cast before shifting: the bytes promote to signed int otherwise,
+        # turning filesizes >= 2**31 negative
+        return (self.buf[90] | self.buf[91] << 8 |
+                (<unsigned int> self.buf[92]) << 16 |
+                (<unsigned int> self.buf[93]) << 24)
+
+    @filesize.setter
+    def filesize(self, unsigned int value):
+        self._set_u16(90, value & 0xffff)
+        self._set_u16(92, value >> 16)
+
+    @property
+    def datatype(self):
+        return self.buf[94]
+
+    @datatype.setter
+    def datatype(self, unsigned char value):
+        self.buf[94] = value
+
+    @property
+    def filetype(self):
+        return self.buf[95]
+
+    @filetype.setter
+    def filetype(self, unsigned char value):
+        self.buf[95] = value
+
+    @property
+    def tinfo1(self):
+        return self._u16(96)
+
+    @tinfo1.setter
+    def tinfo1(self, unsigned int value):
+        self._set_u16(96, value)
+
+    @property
+    def tinfo2(self):
+        return self._u16(98)
+
+    @tinfo2.setter
+    def tinfo2(self, unsigned int value):
+        self._set_u16(98, value)
+
+    @property
+    def tinfo3(self):
+        return self._u16(100)
+
+    @tinfo3.setter
+    def tinfo3(self, unsigned int value):
+        self._set_u16(100, value)
+
+    @property
+    def tinfo4(self):
+        return self._u16(102)
+
+    @tinfo4.setter
+    def tinfo4(self, unsigned int value):
+        self._set_u16(102, value)
+
+    @property
+    def comments(self):
+        return self.buf[104]
+
+    @comments.setter
+    def comments(self, unsigned char value):
+        self.buf[104] = value
+
+    @property
+    def flags(self):
+        return self.buf[105]
+
+    @flags.setter
+    def flags(self, unsigned char value):
+        self.buf[105] = value
+
+    @property
+    def filler(self):
+        return self._string(106, 22)
@@ -2,6 +2,13 @@
 
 from distutils.core import setup
 
+try:
+    # optional accelerator; the pure Python module works without it
+    from Cython.Build import cythonize
+    ext_modules = cythonize(['sauce/_csauce.pyx'])
+except ImportError:
+    ext_modules = []
+
 setup(name='sauce',
     version='1.3',
     description='SAUCE record parser',
@@ -9,4 +16,5 @@ setup(name='sauce',
     author_email='maze@pyth0n.org',
     url='https://github.com/tehmaze/sauce',
     packages=['sauce'],
+    ext_modules=ext_modules,
     )